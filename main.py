@@ -5,6 +5,9 @@ import string
 import os
 import requests  # <-- NEW: For downloading files
 import sys       # <-- NEW: For exiting script on failure
+import json
+from array import array
+from collections import deque
 
 # --- Helper Function for Downloading ---
 def download_file(url, local_path):
@@ -72,8 +75,18 @@ BASE_RESOLUTION_HEIGHT = 1080
 screen_info = pygame.display.Info()
 ACTUAL_SCREEN_WIDTH, ACTUAL_SCREEN_HEIGHT = screen_info.current_w, screen_info.current_h
 
-WIDTH, HEIGHT = ACTUAL_SCREEN_WIDTH, ACTUAL_SCREEN_HEIGHT
-screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
+# --- Render Mode ---
+# When True the game draws at BASE_RESOLUTION and pygame.SCALED lets SDL
+# scale it to the display (mouse coordinates are mapped back for us).
+LOGICAL_RESOLUTION_RENDERING = True
+
+if LOGICAL_RESOLUTION_RENDERING:
+    WIDTH, HEIGHT = BASE_RESOLUTION_WIDTH, BASE_RESOLUTION_HEIGHT
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN | pygame.SCALED)
+else:
+    WIDTH, HEIGHT = ACTUAL_SCREEN_WIDTH, ACTUAL_SCREEN_HEIGHT
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
+
 pygame.display.set_caption("Zuma Wordle Clone - Faster Speed")
 clock = pygame.time.Clock()
 FPS = 60
@@ -88,6 +101,87 @@ def scale_value(val):
 def scale_point(point):
     return (scale_value(point[0]), scale_value(point[1]))
 
+# --- Adaptive Quality Governor ---
+# Tier 0 is full quality; higher tiers trim optional per-frame work so the
+# game keeps its FPS instead of slowing down on weak hardware.
+QUALITY_TIERS = [
+    {"name": "HIGH",   "laser_step": 5,  "cannon_angle_step": 0, "hud_interval": 1,  "recolor_interval": 1},
+    {"name": "MEDIUM", "laser_step": 10, "cannon_angle_step": 2, "hud_interval": 4,  "recolor_interval": 2},
+    {"name": "LOW",    "laser_step": 20, "cannon_angle_step": 5, "hud_interval": 10, "recolor_interval": 6},
+]
+for tier in QUALITY_TIERS:
+    tier["laser_step"] = max(1, scale_value(tier["laser_step"])) # Scaled once, used directly by Launcher.draw
+FRAME_BUDGET_MS = 1000 / FPS
+QUALITY_DOWNGRADE_RATIO = 0.9  # Drop a tier when frames use more than 90% of the budget...
+QUALITY_UPGRADE_RATIO = 0.6    # ...and only climb back once they use less than 60% (hysteresis)
+QUALITY_DOWNGRADE_FRAMES = 30  # Frames over budget before dropping a tier
+QUALITY_UPGRADE_FRAMES = 180   # Frames with headroom before raising a tier
+QUALITY_UPGRADE_REVERT_FRAMES = 600  # Dropping out of a tier this soon after climbing into it counts as a failed upgrade
+QUALITY_MAX_UPGRADE_FRAMES = QUALITY_UPGRADE_FRAMES * 16
+FRAME_TIME_SMOOTHING = 0.1
+QUALITY_GOVERNOR_ENABLED = True
+
+quality_tier = 0
+smoothed_frame_ms = 0.0
+quality_over_budget_frames = 0
+quality_under_budget_frames = 0
+quality_upgrade_frames = [QUALITY_UPGRADE_FRAMES] * len(QUALITY_TIERS) # Headroom frames needed to climb into each tier; doubled on each failed upgrade
+frames_in_quality_tier = 0
+quality_tier_upgraded = False # Whether the current tier was entered by an upgrade
+
+def get_quality_tier():
+    """Returns (tier_index, tier_name) for the current quality tier."""
+    return quality_tier, QUALITY_TIERS[quality_tier]["name"]
+
+def get_quality_setting(key):
+    return QUALITY_TIERS[quality_tier][key]
+
+def set_quality_tier(tier):
+    """Forces a quality tier. The governor keeps adjusting from here while enabled."""
+    global quality_tier, quality_over_budget_frames, quality_under_budget_frames
+    global frames_in_quality_tier, quality_tier_upgraded
+    quality_tier = max(0, min(len(QUALITY_TIERS) - 1, tier))
+    quality_over_budget_frames = 0
+    quality_under_budget_frames = 0
+    frames_in_quality_tier = 0
+    quality_tier_upgraded = False
+
+def update_quality_governor(frame_work_ms):
+    """
+    Feeds the time spent on the last frame (excluding the tick delay)
+    into the governor and steps the quality tier up or down.
+    """
+    global smoothed_frame_ms, quality_over_budget_frames, quality_under_budget_frames
+    global frames_in_quality_tier, quality_tier_upgraded
+    smoothed_frame_ms += (frame_work_ms - smoothed_frame_ms) * FRAME_TIME_SMOOTHING
+    if not QUALITY_GOVERNOR_ENABLED:
+        return
+
+    frames_in_quality_tier += 1
+    if quality_tier_upgraded and frames_in_quality_tier == QUALITY_UPGRADE_REVERT_FRAMES:
+        # The upgrade held, so this tier no longer needs the backoff
+        quality_upgrade_frames[quality_tier] = QUALITY_UPGRADE_FRAMES
+
+    if smoothed_frame_ms > FRAME_BUDGET_MS * QUALITY_DOWNGRADE_RATIO:
+        quality_over_budget_frames += 1
+        quality_under_budget_frames = 0
+        if quality_over_budget_frames >= QUALITY_DOWNGRADE_FRAMES and quality_tier < len(QUALITY_TIERS) - 1:
+            if quality_tier_upgraded and frames_in_quality_tier < QUALITY_UPGRADE_REVERT_FRAMES:
+                # Back off: wait twice as long before trying this tier again
+                quality_upgrade_frames[quality_tier] = min(quality_upgrade_frames[quality_tier] * 2, QUALITY_MAX_UPGRADE_FRAMES)
+            set_quality_tier(quality_tier + 1)
+            print(f"Quality lowered to {get_quality_tier()[1]} ({smoothed_frame_ms:.1f} ms/frame)")
+    elif smoothed_frame_ms < FRAME_BUDGET_MS * QUALITY_UPGRADE_RATIO:
+        quality_under_budget_frames += 1
+        quality_over_budget_frames = 0
+        if quality_tier > 0 and quality_under_budget_frames >= quality_upgrade_frames[quality_tier - 1]:
+            set_quality_tier(quality_tier - 1)
+            quality_tier_upgraded = True
+            print(f"Quality raised to {get_quality_tier()[1]} ({smoothed_frame_ms:.1f} ms/frame)")
+    else:
+        quality_over_budget_frames = 0
+        quality_under_budget_frames = 0
+
 # --- Colors ---
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -252,6 +346,14 @@ ROUGH_PATH_BASE = [
     (BASE_RESOLUTION_WIDTH // 2, BASE_RESOLUTION_HEIGHT // 2 - 50), (BASE_RESOLUTION_WIDTH // 2, BASE_RESOLUTION_HEIGHT // 2)
 ]
 PATH_POINTS_BASE = generate_path_points(ROUGH_PATH_BASE, PATH_POINT_SPACING)
+PATH_POINTS = [scale_point(p) for p in PATH_POINTS_BASE] # Screen coordinates, scaled once
+PATH_COLOR = (80, 80, 80)
+PATH_LINE_WIDTH = max(1, scale_value(4))
+
+# Background with the path already drawn on it, so the path is never redrawn per frame
+path_background_image = background_image.copy()
+if len(PATH_POINTS) > 2:
+    pygame.draw.lines(path_background_image, PATH_COLOR, False, PATH_POINTS, PATH_LINE_WIDTH)
 
 # --- Ball Sprite Class ---
 class Ball(pygame.sprite.Sprite):
@@ -265,7 +367,6 @@ class Ball(pygame.sprite.Sprite):
         self.image = pygame.Surface((BALL_DIAMETER, BALL_DIAMETER), pygame.SRCALPHA)
         self.re_render_image()
 
-        self.x_base, self.y_base = 0, 0
         self.rect = self.image.get_rect()
         
         self.hitbox_size = int(BALL_RADIUS * 0.8) 
@@ -297,31 +398,29 @@ class Ball(pygame.sprite.Sprite):
     def set_pos_from_path_index(self):
         idx = int(self.path_index)
 
-        if idx >= len(PATH_POINTS_BASE):
-            self.x_base, self.y_base = PATH_POINTS_BASE[-1]
+        if idx >= len(PATH_POINTS):
+            self.rect.center = PATH_POINTS[-1]
             global GAME_OVER
             # Don't set GAME_OVER if we won
             if not GAME_WON:
                 GAME_OVER = True
         elif idx < 0:
-            self.x_base, self.y_base = PATH_POINTS_BASE[0]
+            self.rect.center = PATH_POINTS[0]
         else:
-            self.x_base, self.y_base = PATH_POINTS_BASE[idx]
-
-        self.rect.center = scale_point((int(self.x_base), int(self.y_base)))
+            self.rect.center = PATH_POINTS[idx]
         self.shot_hitbox.center = self.rect.center
 
         p1_idx = max(0, idx - int(BALL_SPACING_ON_PATH))
-        p2_idx = min(len(PATH_POINTS_BASE) - 1, idx + int(BALL_SPACING_ON_PATH))
+        p2_idx = min(len(PATH_POINTS) - 1, idx + int(BALL_SPACING_ON_PATH))
 
         if p1_idx >= p2_idx:
-            p1_idx = max(0, len(PATH_POINTS_BASE) - 2)
-            p2_idx = len(PATH_POINTS_BASE) - 1
+            p1_idx = max(0, len(PATH_POINTS) - 2)
+            p2_idx = len(PATH_POINTS) - 1
             if p1_idx >= p2_idx: 
                 p1_idx = 0; p2_idx = 0;
 
-        p1 = scale_point(PATH_POINTS_BASE[p1_idx])
-        p2 = scale_point(PATH_POINTS_BASE[p2_idx])
+        p1 = PATH_POINTS[p1_idx]
+        p2 = PATH_POINTS[p2_idx]
         
         dir_x = p2[0] - p1[0]
         dir_y = p2[1] - p1[1]
@@ -363,6 +462,21 @@ class Launcher:
         self.pos = scale_point(pos_base)
         self.base_image = image
         self.rect = self.base_image.get_rect(center=self.pos)
+        self.rotation_cache = {} # (angle_step, snapped_angle) -> rotated image
+        self.laser_offset = scale_value(20)
+        self.laser_width = max(1, scale_value(3))
+
+    def get_rotated_image(self, angle_degrees):
+        angle_step = get_quality_setting("cannon_angle_step")
+        if not angle_step:
+            return pygame.transform.rotate(self.base_image, angle_degrees - 90)
+
+        # Lower tiers snap the angle and reuse previously rotated images
+        snapped_angle = round(angle_degrees / angle_step) * angle_step
+        key = (angle_step, snapped_angle)
+        if key not in self.rotation_cache:
+            self.rotation_cache[key] = pygame.transform.rotate(self.base_image, snapped_angle - 90)
+        return self.rotation_cache[key]
 
     def draw(self, surface, all_chain_balls):
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -370,16 +484,16 @@ class Launcher:
         angle_radians = math.atan2(-rel_y, rel_x)
         angle_degrees = math.degrees(angle_radians)
 
-        rotated_cannon_image = pygame.transform.rotate(self.base_image, angle_degrees - 90)
+        rotated_cannon_image = self.get_rotated_image(angle_degrees)
         rotated_cannon_rect = rotated_cannon_image.get_rect(center=self.pos)
         surface.blit(rotated_cannon_image, rotated_cannon_rect)
 
         if pygame.mouse.get_focused():
             dx = math.cos(angle_radians)
             dy = -math.sin(angle_radians)
-            laser_start_pos = (self.pos[0] + dx * scale_value(20), self.pos[1] + dy * scale_value(20))
+            laser_start_pos = (self.pos[0] + dx * self.laser_offset, self.pos[1] + dy * self.laser_offset)
             laser_end_pos = (laser_start_pos[0] + dx * 5000, laser_start_pos[1] + dy * 5000)
-            step = scale_value(5)
+            step = get_quality_setting("laser_step")
             max_dist = 5000
             hit_found = False
 
@@ -396,7 +510,7 @@ class Launcher:
                     break
 
             laser_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            pygame.draw.line(laser_surface, LASER_COLOR, laser_start_pos, laser_end_pos, width=scale_value(3))
+            pygame.draw.line(laser_surface, LASER_COLOR, laser_start_pos, laser_end_pos, width=self.laser_width)
             surface.blit(laser_surface, (0, 0))
 
     def get_new_ball(self):
@@ -483,6 +597,238 @@ def create_gap(chain, at_index, gap_size_base):
 all_sprites = pygame.sprite.Group()
 chain_ball_sprites = pygame.sprite.Group()
 
+# --- Game State Snapshots ---
+# A snapshot is a plain dict. The chain's letters/colors are mirrored in
+# chain_segments, a list of small tuples kept in step with chain_list: an
+# insert or removal replaces only the segment(s) it touches (splitting or
+# merging them), so every other segment object is shared between snapshots
+# and taking one every tick only copies the path indices.
+CHAIN_SEGMENT_SIZE = 16
+REWIND_HISTORY_FRAMES = FPS * 10
+SAVE_FILE_PATH = 'savegame.json'
+
+chain_segments = [] # Tuples of (letter, base_color) mirroring chain_list
+_snapshot_rng_state = None
+
+def rebuild_chain_segments():
+    chain_segments[:] = [tuple((ball.letter, ball.base_color) for ball in chain_list[start:start + CHAIN_SEGMENT_SIZE])
+                         for start in range(0, len(chain_list), CHAIN_SEGMENT_SIZE)]
+
+def find_chain_segment(index):
+    """Returns (segment_number, offset) for a chain index. The end of the chain maps past the last segment's end."""
+    for n, segment in enumerate(chain_segments):
+        if index < len(segment):
+            return n, index
+        index -= len(segment)
+    return len(chain_segments) - 1, len(chain_segments[-1])
+
+def store_chain_segment(first, last, segment):
+    """Replaces chain_segments[first:last + 1] with segment, splitting it if it grew too large."""
+    if len(segment) > CHAIN_SEGMENT_SIZE * 2:
+        half = len(segment) // 2
+        chain_segments[first:last + 1] = [segment[:half], segment[half:]]
+    elif segment:
+        chain_segments[first:last + 1] = [segment]
+    else:
+        del chain_segments[first:last + 1]
+
+def chain_segments_insert(index, ball):
+    """Mirrors chain_list.insert(index, ball)."""
+    entry = (ball.letter, ball.base_color)
+    if not chain_segments:
+        chain_segments.append((entry,))
+        return
+    n, offset = find_chain_segment(index)
+    segment = chain_segments[n]
+    store_chain_segment(n, n, segment[:offset] + (entry,) + segment[offset:])
+
+def chain_segments_delete(start, end):
+    """Mirrors del chain_list[start:end]."""
+    first, offset = find_chain_segment(start)
+    last, end_offset = find_chain_segment(end)
+    merged = chain_segments[first][:offset] + chain_segments[last][end_offset:]
+    # Fold a small leftover into its neighbour so segments don't fragment
+    if 0 < len(merged) < CHAIN_SEGMENT_SIZE // 2 and last + 1 < len(chain_segments):
+        last += 1
+        merged += chain_segments[last]
+    store_chain_segment(first, last, merged)
+
+def get_shot_balls():
+    return [s for s in all_sprites if s not in chain_ball_sprites]
+
+def take_snapshot():
+    """Captures the full game state. Cheap enough to call every tick."""
+    global _snapshot_rng_state
+    # The RNG only advances on spawns, so most snapshots share the same state object
+    rng_state = random.getstate()
+    if rng_state != _snapshot_rng_state:
+        _snapshot_rng_state = rng_state
+
+    return {
+        "chain_segments": tuple(chain_segments),
+        "path_indices": array('d', [ball.path_index for ball in chain_list]),
+        "shots": tuple((s.letter, s.rect.x, s.rect.y, s.dx, s.dy, s.speed, s.base_color) for s in get_shot_balls()),
+        "spawn_queue": tuple(spawn_queue),
+        "current_spawn_color_index": current_spawn_color_index,
+        "chain_speed": CHAIN_SPEED,
+        "score": SCORE,
+        "rng_state": _snapshot_rng_state,
+        "game_over": GAME_OVER,
+        "game_won": GAME_WON,
+    }
+
+def restore_snapshot(snapshot):
+    """
+    Restores a state captured by take_snapshot().
+    Chain balls and shots whose letter and color still match are reused instead of re-rendered.
+    """
+    global SCORE, CHAIN_SPEED, current_spawn_color_index, GAME_OVER, GAME_WON
+    global chain_colors_dirty, hud_surfaces
+
+    reusable_balls = {}
+    for ball in chain_list:
+        reusable_balls.setdefault((ball.letter, ball.base_color), []).append(ball)
+    reusable_shots = {}
+    for shot in get_shot_balls():
+        reusable_shots.setdefault((shot.letter, shot.base_color), []).append(shot)
+
+    new_chain = []
+    path_indices = snapshot["path_indices"]
+    for segment in snapshot["chain_segments"]:
+        for letter, base_color in segment:
+            path_index = path_indices[len(new_chain)]
+            pool = reusable_balls.get((letter, base_color))
+            if pool:
+                ball = pool.pop()
+                ball.path_index = path_index
+            else:
+                ball = Ball(letter, path_index, base_color)
+                all_sprites.add(ball)
+                chain_ball_sprites.add(ball)
+            new_chain.append(ball)
+
+    for letter, x, y, dx, dy, speed, base_color in snapshot["shots"]:
+        pool = reusable_shots.get((letter, base_color))
+        if pool:
+            shot = pool.pop()
+        else:
+            shot = Ball(letter, 0, base_color)
+            all_sprites.add(shot)
+        shot.rect.topleft = (x, y)
+        shot.shot_hitbox.center = shot.rect.center
+        shot.dx, shot.dy, shot.speed = dx, dy, speed
+
+    for pool in list(reusable_balls.values()) + list(reusable_shots.values()):
+        for ball in pool:
+            ball.kill()
+
+    chain_list[:] = new_chain
+    chain_segments[:] = snapshot["chain_segments"]
+    for ball in chain_list:
+        ball.set_pos_from_path_index()
+    chain_colors_dirty = True
+
+    spawn_queue[:] = snapshot["spawn_queue"]
+    current_spawn_color_index = snapshot["current_spawn_color_index"]
+    CHAIN_SPEED = snapshot["chain_speed"]
+    SCORE = snapshot["score"]
+    random.setstate(snapshot["rng_state"])
+    GAME_OVER = snapshot["game_over"]
+    GAME_WON = snapshot["game_won"]
+    hud_surfaces = None
+
+def save_game(path=SAVE_FILE_PATH):
+    snapshot = take_snapshot()
+    data = dict(snapshot, path_indices=list(snapshot["path_indices"]))
+    try:
+        with open(path, 'w', encoding="utf-8") as f:
+            json.dump(data, f)
+        print(f"Game saved to {path}")
+        return True
+    except OSError as e:
+        print(f"Error saving game to {path}: {e}")
+        return False
+
+def load_letter_and_color(entry):
+    letter, color = entry
+    return load_letter(letter), load_color(color)
+
+def load_letter(letter):
+    if not isinstance(letter, str) or len(letter) != 1 or not letter.isalpha():
+        raise ValueError(f"invalid letter {letter!r}")
+    return letter
+
+def load_number(value, low=-math.inf, high=math.inf):
+    """Converts value to a finite float within [low, high]."""
+    value = float(value)
+    if not math.isfinite(value) or not low <= value <= high:
+        raise ValueError(f"number out of range: {value!r}")
+    return value
+
+def load_color(color):
+    color = tuple(int(c) for c in color)
+    if len(color) != 3 or not all(0 <= c <= 255 for c in color):
+        raise ValueError(f"invalid color {color!r}")
+    return color
+
+def snapshot_from_json(data):
+    """
+    Converts a loaded save file back into a snapshot dict (JSON turns tuples into lists).
+    Raises ValueError, KeyError, TypeError or OverflowError if the data doesn't describe
+    a valid state, so that restore_snapshot() is only ever handed data it can apply.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("save file does not contain a JSON object")
+
+    segments = tuple(tuple(load_letter_and_color(entry) for entry in segment) for segment in data["chain_segments"])
+    path_indices = array('d', (load_number(index) for index in data["path_indices"]))
+    if len(path_indices) != sum(len(segment) for segment in segments):
+        raise ValueError("path_indices does not match the number of chain balls")
+
+    # Shots outside this area are killed by Ball.update(), so a valid save never holds one
+    max_speed = max(WIDTH, HEIGHT)
+    shots = []
+    for letter, x, y, dx, dy, speed, color in data["shots"]:
+        shots.append((
+            load_letter(letter),
+            int(load_number(x, -BALL_DIAMETER, WIDTH + BALL_DIAMETER)),
+            int(load_number(y, -BALL_DIAMETER, HEIGHT + BALL_DIAMETER)),
+            load_number(dx, -max_speed, max_speed),
+            load_number(dy, -max_speed, max_speed),
+            load_number(speed, 0, max_speed),
+            load_color(color),
+        ))
+
+    version, internal_state, gauss_next = data["rng_state"]
+    rng_state = (version, tuple(internal_state), gauss_next)
+    random.Random().setstate(rng_state) # Validate on a throwaway generator
+
+    return {
+        "chain_segments": tuple(segment for segment in segments if segment),
+        "path_indices": path_indices,
+        "shots": tuple(shots),
+        "spawn_queue": tuple(load_letter_and_color(entry) for entry in data["spawn_queue"]),
+        "current_spawn_color_index": int(data["current_spawn_color_index"]),
+        "chain_speed": load_number(data["chain_speed"]),
+        "score": int(data["score"]),
+        "rng_state": rng_state,
+        "game_over": bool(data["game_over"]),
+        "game_won": bool(data["game_won"]),
+    }
+
+def load_game(path=SAVE_FILE_PATH):
+    try:
+        with open(path, 'r', encoding="utf-8") as f:
+            snapshot = snapshot_from_json(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError, OverflowError) as e:
+        print(f"Error loading game from {path}: {e}")
+        return False
+
+    # snapshot_from_json() has already rejected anything restore_snapshot() could fail on
+    restore_snapshot(snapshot)
+    print(f"Game loaded from {path}")
+    return True
+
 # --- Game Loop Setup ---
 running = True
 launcher = Launcher(LAUNCHER_POS_BASE, cannon_base_image)
@@ -496,10 +842,50 @@ for i in range(STARTING_BALLS): # <-- This is now 20
     all_sprites.add(new_ball)
     chain_ball_sprites.add(new_ball)
     chain_list.append(new_ball)
+rebuild_chain_segments()
 
 SPAWN_DELAY = int((BALL_DIAMETER_BASE / (CHAIN_SPEED * PATH_POINT_SPACING)) * (1000 / FPS))
 last_spawn_time = pygame.time.get_ticks()
 
+frame_count = 0
+chain_colors_dirty = False  # Recoloring is deferred on lower quality tiers
+frames_since_recolor = 0
+hud_surfaces = None         # Cached HUD text, re-rendered every hud_interval frames
+HUD_SCORE_POS = scale_point((20, 20))
+HUD_SPEED_POS = scale_point((20, 60))
+HUD_QUALITY_POS = scale_point((20, 110))
+
+rewind_history = deque(maxlen=REWIND_HISTORY_FRAMES)
+
+def apply_deferred_recolor():
+    """Recolors the chain if it changed, at most once every recolor_interval frames."""
+    global chain_colors_dirty, frames_since_recolor
+    frames_since_recolor += 1
+    if chain_colors_dirty and frames_since_recolor >= get_quality_setting("recolor_interval"):
+        update_chain_colors(chain_list)
+        chain_colors_dirty = False
+        frames_since_recolor = 0
+
+def draw_game_frame():
+    """Draws the playfield, launcher and HUD onto the screen surface."""
+    global hud_surfaces
+    screen.blit(path_background_image, (0, 0))
+
+    all_sprites.draw(screen)
+
+    launcher.draw(screen, chain_ball_sprites)
+
+    if hud_surfaces is None or frame_count % get_quality_setting("hud_interval") == 0:
+        score_text = GAME_FONT.render(f"Score: {SCORE}", True, WHITE)
+        speed_text = GAME_FONT.render(f"Speed: {CHAIN_SPEED:.4f}", True, WHITE)
+        quality_text = SMALL_GAME_FONT.render(f"Quality: {get_quality_tier()[1]} ({smoothed_frame_ms:.1f} ms)", True, WHITE)
+        hud_surfaces = (score_text, speed_text, quality_text)
+
+    score_text, speed_text, quality_text = hud_surfaces
+    screen.blit(score_text, HUD_SCORE_POS)
+    screen.blit(speed_text, HUD_SPEED_POS)
+    screen.blit(quality_text, HUD_QUALITY_POS)
+
 # update_chain_colors(chain_list) # Keep initial chain its base color
 
 
@@ -511,6 +897,11 @@ while running:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 running = False
+            elif event.key == pygame.K_F5:
+                save_game()
+            elif event.key == pygame.K_F9:
+                if load_game():
+                    rewind_history.clear()
             
             if event.key >= pygame.K_a and event.key <= pygame.K_z:
                 if not GAME_OVER and not GAME_WON:
@@ -524,6 +915,16 @@ while running:
                     new_shot.shoot(angle, 35) # <-- Was 20
                     all_sprites.add(new_shot)
 
+    # --- Rewind (hold BACKSPACE) ---
+    if pygame.key.get_pressed()[pygame.K_BACKSPACE] and rewind_history:
+        restore_snapshot(rewind_history.pop())
+        apply_deferred_recolor()
+        draw_game_frame()
+        pygame.display.flip()
+        clock.tick(FPS) # Restore cost isn't gameplay load, so the governor skips rewind frames
+        frame_count += 1
+        continue
+
     # --- Handle Win Screen ---
     if GAME_WON:
         screen.fill(WIN_SCREEN_BG)
@@ -559,6 +960,7 @@ while running:
     #         all_sprites.add(new_ball)
     #         chain_ball_sprites.add(new_ball)
     #         chain_list.append(new_ball)
+    #         chain_segments_insert(len(chain_list) - 1, new_ball)
     #         last_spawn_time = current_time
     #         update_chain_colors(chain_list) 
 
@@ -637,6 +1039,7 @@ while running:
             chain_list.insert(insert_at_index, inserted_ball)
             all_sprites.add(inserted_ball)
             chain_ball_sprites.add(inserted_ball)
+            chain_segments_insert(insert_at_index, inserted_ball)
 
             # --- Combo Logic ---
             while True:
@@ -647,6 +1050,7 @@ while running:
                         chain_list[j].kill()
 
                     del chain_list[start_idx : end_idx + 1]
+                    chain_segments_delete(start_idx, end_idx + 1)
                     
                     # <-- **NEW ROLLBACK LOGIC** ---
                     # Check if a gap was created in the middle of the chain
@@ -671,7 +1075,10 @@ while running:
                 else:
                     break 
             
-            update_chain_colors(chain_list) 
+            chain_colors_dirty = True
+
+    # --- Deferred Recoloring ---
+    apply_deferred_recolor()
 
     # --- Check for Win Condition ---
     if not chain_list:
@@ -680,24 +1087,14 @@ while running:
         if not shot_balls_list_check:
             GAME_WON = True
 
-    # --- Drawing ---
-    screen.blit(background_image, (0, 0))
-
-    if len(PATH_POINTS_BASE) > 2:
-        scaled_path_points = [scale_point(p) for p in PATH_POINTS_BASE]
-        pygame.draw.lines(screen, (80, 80, 80), False, scaled_path_points, scale_value(4))
-
-    all_sprites.draw(screen)
-
-    launcher.draw(screen, chain_ball_sprites)
-
-    score_text = GAME_FONT.render(f"Score: {SCORE}", True, WHITE)
-    screen.blit(score_text, scale_point((20, 20)))
-
-    speed_text = GAME_FONT.render(f"Speed: {CHAIN_SPEED:.4f}", True, WHITE)
-    screen.blit(speed_text, scale_point((20, 60)))
+    # --- Record Rewind History ---
+    rewind_history.append(take_snapshot())
 
+    # --- Drawing ---
+    draw_game_frame()
     pygame.display.flip()
     clock.tick(FPS)
+    update_quality_governor(clock.get_rawtime())
+    frame_count += 1
 
 pygame.quit()
\ No newline at end of file